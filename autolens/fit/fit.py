@@ -30,6 +30,8 @@ class FitImaging(aa_fit.FitImaging):
 
         self.tracer = tracer
 
+        self._galaxy_model_image_dict = None
+
         if use_hyper_scaling:
 
             image = hyper_image_from_image_and_hyper_image_sky(
@@ -99,6 +101,9 @@ class FitImaging(aa_fit.FitImaging):
         """
         A dictionary associating galaxies with their corresponding model images
         """
+        if self._galaxy_model_image_dict is not None:
+            return self._galaxy_model_image_dict
+
         galaxy_model_image_dict = self.tracer.galaxy_blurred_image_dict_from_grid_and_convolver(
             grid=self.grid,
             convolver=self.masked_imaging.convolver,
@@ -117,6 +122,8 @@ class FitImaging(aa_fit.FitImaging):
                 }
             )
 
+        self._galaxy_model_image_dict = galaxy_model_image_dict
+
         return galaxy_model_image_dict
 
     @property
@@ -143,15 +150,15 @@ class FitImaging(aa_fit.FitImaging):
 
         model_images_of_planes = self.model_images_of_planes
 
-        for galaxy_index in range(len(self.tracer.planes)):
+        total_model_image = sum(model_images_of_planes)
 
-            other_planes_model_images = [
-                model_image
-                for i, model_image in enumerate(model_images_of_planes)
-                if i != galaxy_index
-            ]
+        for galaxy_index in range(len(self.tracer.planes)):
 
-            subtracted_image = self.image - sum(other_planes_model_images)
+            subtracted_image = (
+                self.image
+                - total_model_image
+                + model_images_of_planes[galaxy_index]
+            )
 
             subtracted_images_of_planes.append(subtracted_image)
 
@@ -177,7 +184,11 @@ class FitImaging(aa_fit.FitImaging):
 
     @property
     def total_inversions(self):
-        return len(list(filter(None, self.tracer.regularizations_of_planes)))
+        return sum(
+            1
+            for regularization in self.tracer.regularizations_of_planes
+            if regularization is not None
+        )
 
 
 class FitInterferometer(aa_fit.FitInterferometer):
@@ -272,8 +283,9 @@ class FitInterferometer(aa_fit.FitInterferometer):
         )
 
         for path, image in galaxy_model_image_dict.items():
-            if hasattr(image, "slim_binned"):
-                galaxy_model_image_dict[path] = image.slim_binned
+            slim_binned = getattr(image, "slim_binned", None)
+            if slim_binned is not None:
+                galaxy_model_image_dict[path] = slim_binned
 
         # TODO : Extend to multiple inversioons across Planes
 
@@ -330,7 +342,11 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
     @property
     def total_inversions(self):
-        return len(list(filter(None, self.tracer.regularizations_of_planes)))
+        return sum(
+            1
+            for regularization in self.tracer.regularizations_of_planes
+            if regularization is not None
+        )
 
 
 def hyper_image_from_image_and_hyper_image_sky(image, hyper_image_sky):
@@ -28,11 +28,7 @@ class AbstractPositionsSolver:
             )
         )
 
-        grid_mag = []
-
-        for index, magnification in enumerate(magnifications):
-            if magnification > self.magnification_threshold:
-                grid_mag.append(grid[index, :])
+        grid_mag = np.asarray(grid)[magnifications > self.magnification_threshold, :]
 
         return grids.Grid2DIrregularUniform(
             grid=grid_mag, pixel_scales=grid.pixel_scales
@@ -64,11 +60,12 @@ class AbstractPositionsSolver:
 
             centres = lensing_obj.extract_attribute(cls=mp.MassProfile, name="centre")
 
+            grid = np.asarray(grid)
+
             for centre in centres.in_list:
 
-                distances_1d = np.sqrt(
-                    np.square(grid[:, 0] - centre[0])
-                    + np.square(grid[:, 1] - centre[1])
+                distances_1d = np.hypot(
+                    grid[:, 0] - centre[0], grid[:, 1] - centre[1]
                 )
 
                 grid = grid_outside_distance_mask_from(
@@ -174,7 +171,7 @@ class AbstractPositionsSolver:
         grid_peaks = grid_peaks_from(
             distance_1d=source_plane_distances,
             grid_slim=grid,
-            neighbors=neighbors.astype("int"),
+            neighbors=neighbors,
             has_neighbors=has_neighbors,
         )
 
@@ -318,7 +315,7 @@ class PositionsSolver(AbstractPositionsSolver):
         if len(grid) == 0:
             return None
         else:
-            return [tuple(coordinate) for coordinate in grid]
+            return np.asarray(grid)
 
     def solve(self, lensing_obj, source_plane_coordinate):
 
@@ -356,11 +353,14 @@ class PositionsSolver(AbstractPositionsSolver):
                 )
 
                 if refined_coordinates is not None:
-                    refined_coordinates_list += refined_coordinates
+                    refined_coordinates_list.append(refined_coordinates)
 
-            refined_coordinates_list = grid_remove_duplicates(
-                grid=np.asarray(refined_coordinates_list)
-            )
+            if len(refined_coordinates_list) > 0:
+                refined_grid = np.concatenate(refined_coordinates_list)
+            else:
+                refined_grid = np.zeros(shape=(0, 2))
+
+            refined_coordinates_list = grid_remove_duplicates(grid=refined_grid)
 
             pixel_scale = pixel_scale / self.upscale_factor
 
@@ -385,18 +385,18 @@ class PositionsSolver(AbstractPositionsSolver):
 @decorator_util.jit()
 def grid_remove_duplicates(grid):
 
-    tolerance = 1e-8
+    tolerance_squared = 1e-8 ** 2.0
 
     grid_no_duplicates = []
 
-    separations = np.zeros((grid.shape[0], grid.shape[0]))
+    separations_squared = np.zeros((grid.shape[0], grid.shape[0]))
 
     for i in range(grid.shape[0]):
         for j in range(grid.shape[0]):
-            separations[i, j] = np.sqrt(
-                np.square(grid[i, 0] - grid[j, 0]) + np.square(grid[i, 1] - grid[j, 1])
-            )
-            separations[i, i] = tolerance * 2
+            separations_squared[i, j] = np.square(
+                grid[i, 0] - grid[j, 0]
+            ) + np.square(grid[i, 1] - grid[j, 1])
+            separations_squared[i, i] = tolerance_squared * 2
 
     for i in range(grid.shape[0]):
 
@@ -404,11 +404,11 @@ def grid_remove_duplicates(grid):
 
         for j in range(grid.shape[0]):
 
-            if separations[i, j] < tolerance:
+            if separations_squared[i, j] < tolerance_squared:
 
                 is_duplicate = True
-                separations[i, j] = tolerance * 2
-                separations[j, i] = tolerance * 2
+                separations_squared[i, j] = tolerance_squared * 2
+                separations_squared[j, i] = tolerance_squared * 2
 
         if not is_duplicate:
             grid_no_duplicates.append((grid[i, 0], grid[i, 1]))
@@ -533,7 +533,7 @@ def grid_square_neighbors_1d_from(shape_slim):
     shape_of_edge = int(np.sqrt(shape_slim))
 
     has_neighbors = np.full(shape=shape_slim, fill_value=False)
-    neighbors_1d = np.full(shape=(shape_slim, 8), fill_value=-1.0)
+    neighbors_1d = np.full(shape=(shape_slim, 8), fill_value=-1)
 
     index = 0
 
@@ -578,7 +578,7 @@ def grid_peaks_from(distance_1d, grid_slim, neighbors, has_neighbors):
         An array of bools, where `True` means a pixel has 8 neighbors and `False` means it has less than 8 and is not
         compared to the source distance.
     """
-    peaks_list = []
+    is_peak = np.full(shape=grid_slim.shape[0], fill_value=False)
 
     for grid_index in range(grid_slim.shape[0]):
 
@@ -597,9 +597,19 @@ def grid_peaks_from(distance_1d, grid_slim, neighbors, has_neighbors):
                 and distance <= distance_1d[neighbors[grid_index, 7]]
             ):
 
-                peaks_list.append(grid_slim[grid_index])
+                is_peak[grid_index] = True
+
+    grid_peaks = np.zeros(shape=(np.sum(is_peak), 2))
+
+    peak_index = 0
+
+    for grid_index in range(grid_slim.shape[0]):
+        if is_peak[grid_index]:
+
+            grid_peaks[peak_index, :] = grid_slim[grid_index, :]
+            peak_index += 1
 
-    return peaks_list
+    return grid_peaks
 
 
 @decorator_util.jit()
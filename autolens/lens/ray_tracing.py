@@ -64,23 +64,23 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @property
     def has_light_profile(self):
-        return any(list(map(lambda plane: plane.has_light_profile, self.planes)))
+        return any(plane.has_light_profile for plane in self.planes)
 
     @property
     def has_mass_profile(self):
-        return any(list(map(lambda plane: plane.has_mass_profile, self.planes)))
+        return any(plane.has_mass_profile for plane in self.planes)
 
     @property
     def has_pixelization(self):
-        return any(list(map(lambda plane: plane.has_pixelization, self.planes)))
+        return any(plane.has_pixelization for plane in self.planes)
 
     @property
     def has_regularization(self):
-        return any(list(map(lambda plane: plane.has_regularization, self.planes)))
+        return any(plane.has_regularization for plane in self.planes)
 
     @property
     def has_hyper_galaxy(self):
-        return any(list(map(lambda plane: plane.has_hyper_galaxy, self.planes)))
+        return any(plane.has_hyper_galaxy for plane in self.planes)
 
     @property
     def upper_plane_index_with_light_profile(self):
@@ -281,14 +281,10 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @property
     def plane_indexes_with_pixelizations(self):
-        plane_indexes_with_inversions = [
-            plane_index if plane.has_pixelization else None
-            for (plane_index, plane) in enumerate(self.planes)
-        ]
         return [
             plane_index
-            for plane_index in plane_indexes_with_inversions
-            if plane_index is not None
+            for (plane_index, plane) in enumerate(self.planes)
+            if plane.has_pixelization
         ]
 
     @property
@@ -81,7 +81,7 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
             for i in range(self.settings.settings_lens.stochastic_likelihood_resamples):
 
-                settings_pixelization = copy.deepcopy(
+                settings_pixelization = copy.copy(
                     self.settings.settings_pixelization
                 )
 
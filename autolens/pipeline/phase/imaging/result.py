@@ -55,8 +55,11 @@ class Result(dataset.Result):
         """
         A dictionary associating galaxy names with model images of those galaxies
         """
+
+        galaxy_model_image_dict = self.max_log_likelihood_fit.galaxy_model_image_dict
+
         return {
-            galaxy_path: self.image_for_galaxy(galaxy)
+            galaxy_path: galaxy_model_image_dict[galaxy]
             for galaxy_path, galaxy in self.path_galaxy_tuples
         }
 
@@ -70,13 +73,15 @@ class Result(dataset.Result):
             "hyper_minimum_percent"
         ]
 
+        image_galaxy_dict = self.image_galaxy_dict
+
         hyper_galaxy_image_path_dict = {}
 
         for path, galaxy in self.path_galaxy_tuples:
 
-            galaxy_image = self.image_galaxy_dict[path]
+            galaxy_image = image_galaxy_dict[path]
 
-            if not np.all(galaxy_image == 0):
+            if np.any(galaxy_image):
                 minimum_galaxy_value = hyper_minimum_percent * max(galaxy_image)
                 galaxy_image[galaxy_image < minimum_galaxy_value] = minimum_galaxy_value
 
@@ -92,7 +97,9 @@ class Result(dataset.Result):
             mask=self.mask.mask_sub_1,
         )
 
+        hyper_galaxy_image_path_dict = self.hyper_galaxy_image_path_dict
+
         for path, galaxy in self.path_galaxy_tuples:
-            hyper_model_image += self.hyper_galaxy_image_path_dict[path]
+            hyper_model_image += hyper_galaxy_image_path_dict[path]
 
         return hyper_model_image
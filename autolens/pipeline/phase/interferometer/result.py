@@ -54,8 +54,13 @@ class Result(dataset.Result):
         """
         A dictionary associating galaxy names with model visibilities of those galaxies
         """
+
+        galaxy_model_visibilities_dict = (
+            self.max_log_likelihood_fit.galaxy_model_visibilities_dict
+        )
+
         return {
-            galaxy_path: self.visibilities_for_galaxy(galaxy)
+            galaxy_path: galaxy_model_visibilities_dict[galaxy]
             for galaxy_path, galaxy in self.path_galaxy_tuples
         }
 
@@ -65,13 +70,13 @@ class Result(dataset.Result):
         A dictionary associating 1D hyper_galaxies galaxy visibilities with their names.
         """
 
+        visibilities_galaxy_dict = self.visibilities_galaxy_dict
+
         hyper_galaxy_visibilities_path_dict = {}
 
         for path, galaxy in self.path_galaxy_tuples:
 
-            hyper_galaxy_visibilities_path_dict[path] = self.visibilities_galaxy_dict[
-                path
-            ]
+            hyper_galaxy_visibilities_path_dict[path] = visibilities_galaxy_dict[path]
 
         return hyper_galaxy_visibilities_path_dict
 
@@ -82,8 +87,10 @@ class Result(dataset.Result):
             shape_slim=(self.max_log_likelihood_fit.visibilities.shape_slim,)
         )
 
+        hyper_galaxy_visibilities_path_dict = self.hyper_galaxy_visibilities_path_dict
+
         for path, galaxy in self.path_galaxy_tuples:
-            hyper_model_visibilities += self.hyper_galaxy_visibilities_path_dict[path]
+            hyper_model_visibilities += hyper_galaxy_visibilities_path_dict[path]
 
         return hyper_model_visibilities
 
@@ -106,8 +113,11 @@ class Result(dataset.Result):
         """
         A dictionary associating galaxy names with model images of those galaxies
         """
+
+        galaxy_model_image_dict = self.max_log_likelihood_fit.galaxy_model_image_dict
+
         return {
-            galaxy_path: self.image_for_galaxy(galaxy)
+            galaxy_path: galaxy_model_image_dict[galaxy]
             for galaxy_path, galaxy in self.path_galaxy_tuples
         }
 
@@ -121,13 +131,15 @@ class Result(dataset.Result):
             "hyper_minimum_percent"
         ]
 
+        image_galaxy_dict = self.image_galaxy_dict
+
         hyper_galaxy_image_path_dict = {}
 
         for path, galaxy in self.path_galaxy_tuples:
 
-            galaxy_image = self.image_galaxy_dict[path]
+            galaxy_image = image_galaxy_dict[path]
 
-            if not np.all(galaxy_image == 0):
+            if np.any(galaxy_image):
                 minimum_galaxy_value = hyper_minimum_percent * max(galaxy_image)
                 galaxy_image[galaxy_image < minimum_galaxy_value] = minimum_galaxy_value
 
@@ -143,7 +155,9 @@ class Result(dataset.Result):
             mask=self.real_space_mask.mask_sub_1,
         )
 
+        hyper_galaxy_image_path_dict = self.hyper_galaxy_image_path_dict
+
         for path, galaxy in self.path_galaxy_tuples:
-            hyper_model_image += self.hyper_galaxy_image_path_dict[path]
+            hyper_model_image += hyper_galaxy_image_path_dict[path]
 
         return hyper_model_image
@@ -26,6 +26,9 @@ class FitImagingPlotter(fit_imaging_plotters.AbstractFitImagingPlotter):
             visuals_2d=visuals_2d,
         )
 
+        self._visuals_with_include_2d = None
+        self._tracer_plotter = None
+
     @property
     def visuals_with_include_2d(self) -> lensing_visuals.Visuals2D:
         """
@@ -50,11 +53,14 @@ class FitImagingPlotter(fit_imaging_plotters.AbstractFitImagingPlotter):
             The collection of attributes that can be plotted by a `Plotter2D` object.
         """
 
+        if self._visuals_with_include_2d is not None:
+            return self._visuals_with_include_2d
+
         visuals_2d = super(FitImagingPlotter, self).visuals_with_include_2d
 
         visuals_2d.mask = None
 
-        return visuals_2d + visuals_2d.__class__(
+        self._visuals_with_include_2d = visuals_2d + visuals_2d.__class__(
             light_profile_centres=self.extract_2d(
                 "light_profile_centres",
                 self.tracer.planes[0].extract_attribute(
@@ -74,19 +80,26 @@ class FitImagingPlotter(fit_imaging_plotters.AbstractFitImagingPlotter):
             ),
         )
 
+        return self._visuals_with_include_2d
+
     @property
     def tracer(self):
         return self.fit.tracer
 
     @property
     def tracer_plotter(self):
-        return ray_tracing_plotters.TracerPlotter(
-            tracer=self.tracer,
-            grid=self.fit.grid,
-            mat_plot_2d=self.mat_plot_2d,
-            visuals_2d=self.visuals_2d,
-            include_2d=self.include_2d,
-        )
+
+        if self._tracer_plotter is None:
+
+            self._tracer_plotter = ray_tracing_plotters.TracerPlotter(
+                tracer=self.tracer,
+                grid=self.fit.grid,
+                mat_plot_2d=self.mat_plot_2d,
+                visuals_2d=self.visuals_2d,
+                include_2d=self.include_2d,
+            )
+
+        return self._tracer_plotter
 
     def inversion_plotter_of_plane(self, plane_index):
         inversion_plotter = inversion_plotters.InversionPlotter(
@@ -166,6 +179,12 @@ class FitImagingPlotter(fit_imaging_plotters.AbstractFitImagingPlotter):
 
         plane_indexes = self.plane_indexes_from_plane_index(plane_index=plane_index)
 
+        if subtracted_image or model_image:
+            model_images_of_planes = self.fit.model_images_of_planes
+
+        if subtracted_image:
+            subtracted_images_of_planes = self.fit.subtracted_images_of_planes
+
         for plane_index in plane_indexes:
 
             if subtracted_image:
@@ -181,14 +200,14 @@ class FitImagingPlotter(fit_imaging_plotters.AbstractFitImagingPlotter):
                     vmax = None
 
                 self.mat_plot_2d.cmap.kwargs["vmin"] = np.max(
-                    self.fit.model_images_of_planes[plane_index]
+                    model_images_of_planes[plane_index]
                 )
                 self.mat_plot_2d.cmap.kwargs["vmax"] = np.min(
-                    self.fit.model_images_of_planes[plane_index]
+                    model_images_of_planes[plane_index]
                 )
 
                 self.mat_plot_2d.plot_array(
-                    array=self.fit.subtracted_images_of_planes[plane_index],
+                    array=subtracted_images_of_planes[plane_index],
                     visuals_2d=self.visuals_with_include_2d,
                     auto_labels=mp.AutoLabels(
                         title=f"Subtracted Image of Plane {plane_index}",
@@ -204,7 +223,7 @@ class FitImagingPlotter(fit_imaging_plotters.AbstractFitImagingPlotter):
                 if self.fit.inversion is None or plane_index == 0:
 
                     self.mat_plot_2d.plot_array(
-                        array=self.fit.model_images_of_planes[plane_index],
+                        array=model_images_of_planes[plane_index],
                         visuals_2d=self.visuals_with_include_2d,
                         auto_labels=mp.AutoLabels(
                             title=f"Model Image of Plane {plane_index}",
@@ -29,6 +29,8 @@ class FitInterferometerPlotter(fit_interferometer_plotters.FitInterferometerPlot
             visuals_2d=visuals_2d,
         )
 
+        self._tracer_plotter = None
+
     @property
     def visuals_with_include_2d(self) -> lensing_visuals.Visuals2D:
         """
@@ -77,13 +79,18 @@ class FitInterferometerPlotter(fit_interferometer_plotters.FitInterferometerPlot
 
     @property
     def tracer_plotter(self):
-        return ray_tracing_plotters.TracerPlotter(
-            tracer=self.tracer,
-            grid=self.fit.masked_interferometer.grid,
-            mat_plot_2d=self.mat_plot_2d,
-            visuals_2d=self.visuals_2d,
-            include_2d=self.include_2d,
-        )
+
+        if self._tracer_plotter is None:
+
+            self._tracer_plotter = ray_tracing_plotters.TracerPlotter(
+                tracer=self.tracer,
+                grid=self.fit.masked_interferometer.grid,
+                mat_plot_2d=self.mat_plot_2d,
+                visuals_2d=self.visuals_2d,
+                include_2d=self.include_2d,
+            )
+
+        return self._tracer_plotter
 
     @property
     def inversion_plotter(self):
@@ -19,10 +19,10 @@ def set_config_path():
 
 class PlotPatch:
     def __init__(self):
-        self.paths = []
+        self.paths = set()
 
     def __call__(self, path, *args, **kwargs):
-        self.paths.append(path)
+        self.paths.add(path)
 
 
 @pytest.fixture(name="plot_patch")
@@ -14,7 +14,7 @@ directory = path.dirname(path.realpath(__file__))
 # Lens Datasets #
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="module")
 def set_config_path(request):
 
     conf.instance.push(
@@ -23,22 +23,22 @@ def set_config_path(request):
     )
 
 
-@pytest.fixture(name="mask_7x7")
+@pytest.fixture(name="mask_7x7", scope="session")
 def make_mask_7x7():
     return fixtures.make_mask_7x7()
 
 
-@pytest.fixture(name="sub_mask_7x7")
+@pytest.fixture(name="sub_mask_7x7", scope="session")
 def make_sub_mask_7x7():
     return fixtures.make_sub_mask_7x7()
 
 
-@pytest.fixture(name="mask_7x7_1_pix")
+@pytest.fixture(name="mask_7x7_1_pix", scope="session")
 def make_mask_7x7_1_pix():
     return fixtures.make_mask_7x7_1_pix()
 
 
-@pytest.fixture(name="blurring_mask_7x7")
+@pytest.fixture(name="blurring_mask_7x7", scope="session")
 def make_blurring_mask_7x7():
     return fixtures.make_blurring_mask_7x7()
 
@@ -83,7 +83,7 @@ def make_noise_map_7x7():
     return fixtures.make_noise_map_7x7()
 
 
-@pytest.fixture(name="psf_3x3")
+@pytest.fixture(name="psf_3x3", scope="session")
 def make_psf_3x3():
     return fixtures.make_psf_3x3()
 
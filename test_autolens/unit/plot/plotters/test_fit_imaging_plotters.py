@@ -9,9 +9,7 @@ directory = path.dirname(path.realpath(__file__))
 
 @pytest.fixture(name="plot_path")
 def make_fit_imaging_plotter_setup():
-    return path.join(
-        "{}".format(path.dirname(path.realpath(__file__))), "files", "plots", "fit"
-    )
+    return path.join(directory, "files", "plots", "fit")
 
 
 def test__fit_quantities_are_output(
@@ -42,7 +40,7 @@ def test__fit_quantities_are_output(
     assert path.join(plot_path, "normalized_residual_map.png") in plot_patch.paths
     assert path.join(plot_path, "chi_squared_map.png") in plot_patch.paths
 
-    plot_patch.paths = []
+    plot_patch.paths = set()
 
     fit_imaging_plotter.figures(
         image=True,
@@ -82,7 +80,7 @@ def test__figures_of_plane(
     assert path.join(plot_path, "plane_image_of_plane_0.png") in plot_patch.paths
     assert path.join(plot_path, "plane_image_of_plane_1.png") in plot_patch.paths
 
-    plot_patch.paths = []
+    plot_patch.paths = set()
 
     fit_imaging_plotter.figures_of_planes(
         subtracted_image=True, model_image=True, plane_image=True, plane_index=0
@@ -127,7 +125,7 @@ def test__subplot_of_planes(
     assert path.join(plot_path, "subplot_of_plane_0.png") in plot_patch.paths
     assert path.join(plot_path, "subplot_of_plane_1.png") in plot_patch.paths
 
-    plot_patch.paths = []
+    plot_patch.paths = set()
 
     fit_imaging_plotter.subplot_of_planes(plane_index=0)
 
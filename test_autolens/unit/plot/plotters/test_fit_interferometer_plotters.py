@@ -2,12 +2,12 @@ from os import path
 import autolens.plot as aplt
 import pytest
 
+directory = path.dirname(path.realpath(__file__))
+
 
 @pytest.fixture(name="plot_path")
 def make_fit_imaging_plotter_setup():
-    return path.join(
-        "{}".format(path.dirname(path.realpath(__file__))), "files", "plots", "fit"
-    )
+    return path.join(directory, "files", "plots", "fit")
 
 
 def test__fit_quantities_are_output(
@@ -64,7 +64,7 @@ def test__fit_quantities_are_output(
     )
     assert path.join(plot_path, "image.png") in plot_patch.paths
 
-    plot_patch.paths = []
+    plot_patch.paths = set()
 
     fit_interferometer_plotter.figures(
         visibilities=True,
@@ -123,7 +123,7 @@ def test__fit_sub_plot_real_space(
     fit_interferometer_plotter.subplot_fit_real_space()
     assert path.join(plot_path, "subplot_fit_real_space.png") in plot_patch.paths
 
-    plot_patch.paths = []
+    plot_patch.paths = set()
 
     fit_interferometer_plotter = aplt.FitInterferometerPlotter(
         fit=masked_interferometer_fit_x2_plane_inversion_7x7,
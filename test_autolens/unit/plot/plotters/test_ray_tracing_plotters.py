@@ -10,12 +10,7 @@ directory = path.dirname(path.realpath(__file__))
 
 @pytest.fixture(name="plot_path")
 def make_fit_imaging_plotter_setup():
-    return path.join(
-        "{}".format(path.dirname(path.realpath(__file__))),
-        "files",
-        "plots",
-        "ray_tracing",
-    )
+    return path.join(directory, "files", "plots", "ray_tracing")
 
 
 def test__all_individual_plotter(
@@ -58,7 +53,7 @@ def test__all_individual_plotter(
 
     assert path.join(plot_path, "contribution_map.png") in plot_patch.paths
 
-    plot_patch.paths = []
+    plot_patch.paths = set()
 
     tracer_plotter = aplt.TracerPlotter(
         tracer=tracer_x2_plane_7x7,
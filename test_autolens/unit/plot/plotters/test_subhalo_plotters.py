@@ -10,9 +10,7 @@ directory = path.dirname(path.realpath(__file__))
 
 @pytest.fixture(name="plot_path")
 def make_fit_imaging_plotter_setup():
-    return path.join(
-        "{}".format(path.dirname(path.realpath(__file__))), "files", "plots", "fit"
-    )
+    return path.join(directory, "files", "plots", "fit")
 
 
 def test__subhalo_detection_sub_plot(